@@ -1,14 +1,16 @@
 import curses
 from enum import Enum, auto
 from math import ceil
-from typing import List, Tuple
-from copy import deepcopy
+from typing import Dict, List, Optional, Set, Tuple
 import socket
+import select
 import argparse
-from itertools import chain
-from random import randint
+from itertools import chain, product
+from random import shuffle
 
 PORT = 8047
+# Seconds to wait for the opponent before handing control back to the game loop
+POLL_TIMEOUT = 0.05
 
 
 class Direction(Enum):
@@ -18,15 +20,38 @@ class Direction(Enum):
     RIGHT = auto()
 
 
+DIRECTION_DELTA = {
+    Direction.UP: (-1, 0),
+    Direction.DOWN: (1, 0),
+    Direction.LEFT: (0, -1),
+    Direction.RIGHT: (0, 1),
+}
+
+
+CLOCKWISE_ROTATION = {
+    Direction.UP: Direction.RIGHT,
+    Direction.RIGHT: Direction.DOWN,
+    Direction.DOWN: Direction.LEFT,
+    Direction.LEFT: Direction.UP,
+}
+
+
 def rotate_clockwise(direction: Direction):
-    if direction == Direction.UP:
-        return Direction.RIGHT
-    elif direction == Direction.RIGHT:
-        return Direction.DOWN
-    elif direction == Direction.DOWN:
-        return Direction.LEFT
-    elif direction == Direction.LEFT:
-        return Direction.UP
+    return CLOCKWISE_ROTATION[direction]
+
+
+# Cell offsets from the start position for each (rotation, size) pair
+OFFSET_CACHE: Dict[Tuple[Direction, int], Tuple[Tuple[int, int], ...]] = {}
+
+
+def ship_offsets(rotation: Direction, size: int) -> Tuple[Tuple[int, int], ...]:
+    key = (rotation, size)
+    offsets = OFFSET_CACHE.get(key)
+    if offsets is None:
+        dy, dx = DIRECTION_DELTA[rotation]
+        offsets = tuple((dy * i, dx * i) for i in range(size))
+        OFFSET_CACHE[key] = offsets
+    return offsets
 
 
 def pos_in_bounds(pos, bounds_y, bounds_x) -> bool:
@@ -45,17 +70,19 @@ class HitType(Enum):
 
 
 class Hit:
+    __slots__ = ("target_position", "hit_type", "character", "ship_positions")
+
     def __init__(
         self,
         target_pos: Tuple[int, int],
         hit_type: HitType,
         char: str,
-        positions: List[Tuple[int, int]] = [],
+        positions: Optional[Tuple[Tuple[int, int], ...]] = None,
     ):
         self.target_position = target_pos
         self.hit_type = hit_type
         self.character = char
-        self.ship_positions = positions
+        self.ship_positions = positions if positions is not None else ()
 
     @staticmethod
     def miss(target_pos: Tuple[int, int]):
@@ -67,7 +94,9 @@ class Hit:
 
     @staticmethod
     def sunk(
-        target_pos: Tuple[int, int], ship_char: str, positions: List[Tuple[int, int]]
+        target_pos: Tuple[int, int],
+        ship_char: str,
+        positions: Tuple[Tuple[int, int], ...],
     ):
         return Hit(target_pos, HitType.SUNK, ship_char, positions)
 
@@ -96,7 +125,7 @@ class CopyCatAI(AI):
         self.last_player_move = None
 
     def place_ships(self):
-        self.fleet = deepcopy(self.manager.fleet)
+        self.fleet = self.manager.fleet.clone()
 
     def get_move(self, move: Tuple[int, int]) -> Hit:
         self.last_player_move = move
@@ -113,31 +142,23 @@ class CopyCatWithRandomMissilesAI(AI):
 
     def initialize(self):
         self.possible_moves = list(
-            chain.from_iterable(
-                [
-                    list(
-                        zip(
-                            [i] * self.manager.player_bounds_x[1],
-                            range(
-                                self.manager.player_bounds_x[0] + 1,
-                                self.manager.player_bounds_x[1],
-                            ),
-                        )
-                    )
-                    for i in range(
-                        self.manager.player_bounds_y[0] + 1,
-                        self.manager.player_bounds_y[1],
-                    )
-                ]
+            product(
+                range(
+                    self.manager.player_bounds_y[0] + 1, self.manager.player_bounds_y[1]
+                ),
+                range(
+                    self.manager.player_bounds_x[0] + 1, self.manager.player_bounds_x[1]
+                ),
             )
         )
+        # Shuffle once so moves can be popped from the end
+        shuffle(self.possible_moves)
 
     def place_ships(self):
-        self.fleet = deepcopy(self.manager.fleet)
+        self.fleet = self.manager.fleet.clone()
 
     def send_move(self) -> Tuple[int, int]:
-        move_idx = randint(0, len(self.possible_moves) - 1)
-        return self.possible_moves.pop(move_idx)
+        return self.possible_moves.pop()
 
 
 class OmniscientAI(AI):
@@ -145,7 +166,7 @@ class OmniscientAI(AI):
         super().__init__(manager)
 
     def place_ships(self):
-        self.fleet = deepcopy(self.manager.fleet)
+        self.fleet = self.manager.fleet.clone()
 
     def send_move(self) -> Tuple[int, int]:
         ...
@@ -158,12 +179,14 @@ class AIType(Enum):
 
     @staticmethod
     def get_ai(ai_type):
-        if ai_type == AIType.CopyCat:
-            return CopyCatAI
-        elif ai_type == AIType.CopyCatWithRandomMissiles:
-            return CopyCatWithRandomMissilesAI
-        elif ai_type == AIType.Omniscient:
-            return OmniscientAI
+        return AI_CLASSES[ai_type]
+
+
+AI_CLASSES = {
+    AIType.CopyCat: CopyCatAI,
+    AIType.CopyCatWithRandomMissiles: CopyCatWithRandomMissilesAI,
+    AIType.Omniscient: OmniscientAI,
+}
 
 
 class Player:
@@ -180,23 +203,49 @@ class Multiplayer(Player):
     def __init__(self, connection, opponent_addr, first_turn):
         self.connection: socket.socket = connection
         self.opponent_addr = opponent_addr
+        # Moves are tiny messages, send them right away instead of waiting on Nagle
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        # Messages are newline delimited, partial messages stay in the buffer
+        self.recv_buffer = bytearray()
+        self.wfile = connection.makefile("wb", buffering=0)
         super().__init__(first_turn)
 
+    def __send_message(self, message: str):
+        self.wfile.write(("%s\n" % message).encode())
+        self.wfile.flush()
+
+    def __receive_message(self) -> Optional[str]:
+        if b"\n" not in self.recv_buffer:
+            readable, _, _ = select.select([self.connection], [], [], POLL_TIMEOUT)
+            if not readable:
+                return None
+            data = self.connection.recv(65536)
+            if not data:
+                raise ConnectionError("Opponent disconnected")
+            self.recv_buffer += data
+            if b"\n" not in self.recv_buffer:
+                return None
+        message, _, self.recv_buffer = self.recv_buffer.partition(b"\n")
+        return message.decode()
+
     def ready(self):
-        self.connection.send("ready".encode())
-        while True:
-            rec_msg = self.connection.recv(1024).decode()
-            if rec_msg == "ready":
-                break
+        self.__send_message("ready")
+
+    def try_ready(self) -> bool:
+        return self.__receive_message() == "ready"
 
     def send_move(self, pos) -> Hit:
-        self.connection.send("move_%d_%d" % pos)
+        self.__send_message("move_%d_%d" % pos)
 
-    def listen_for_move(self) -> str:
-        while True:
-            rec_msg = self.connection.recv(1024).decode()
-            if rec_msg.starstwith("move_"):
-                return rec_msg
+    def try_receive(self) -> Optional[Hit]:
+        rec_msg = self.__receive_message()
+        if rec_msg is None or not rec_msg.startswith("move_"):
+            return None
+        _, y, x = rec_msg.split("_")
+        return self.manager.fleet.check_hit((int(y), int(x)))
 
 
 class LocalPlayer(Player):
@@ -212,10 +261,13 @@ class LocalPlayer(Player):
     def ready(self):
         self.ai.place_ships()
 
+    def try_ready(self) -> bool:
+        return True
+
     def send_move(self, move: Tuple[int, int]) -> Hit:
         return self.ai.get_move(move)
 
-    def listen_for_move(self) -> Hit:
+    def try_receive(self) -> Optional[Hit]:
         ai_move = self.ai.send_move()
         return self.manager.fleet.check_hit(ai_move)
 
@@ -250,16 +302,16 @@ class ShipType(Enum):
 
     @staticmethod
     def size_of(ship_type):
-        if ship_type == ShipType.PatrolBoat:
-            return 2
-        elif ship_type == ShipType.Submarine:
-            return 3
-        elif ship_type == ShipType.Destroyer:
-            return 3
-        elif ship_type == ShipType.Battleship:
-            return 4
-        elif ship_type == ShipType.Carrier:
-            return 5
+        return SHIP_SIZES[ship_type]
+
+
+SHIP_SIZES = {
+    ShipType.PatrolBoat: 2,
+    ShipType.Submarine: 3,
+    ShipType.Destroyer: 3,
+    ShipType.Battleship: 4,
+    ShipType.Carrier: 5,
+}
 
 
 class Ship:
@@ -273,46 +325,41 @@ class Ship:
     ):
         self.ship_type = ship_type
         self.size = ShipType.size_of(self.ship_type)
-        self.hits = [False for _ in range(self.size)]
+        # Bitmask of hit cells, the ship is sunk when every bit is set
+        self.hits = 0
+        self.sunk_mask = (1 << self.size) - 1
         self.start_pos = start_pos
         self.rotation = rotation
         self.bounds_y = bounds_y
         self.bounds_x = bounds_x
-        self.positions: List[Tuple[int, int]] = []
+        # Immutable, so sunk hits and the fleet can share it without copying
+        self.positions: Tuple[Tuple[int, int], ...] = ()
         self.update_positions(self.start_pos)
 
     @staticmethod
     def generate_positions(
         start_pos: Tuple[int, int], rotation: Direction, ship_size: int
-    ) -> List[Tuple[int, int]]:
-        positions = []
-        for i in range(ship_size):
-            y, x = start_pos
-            if rotation == Direction.RIGHT:
-                x += i
-            elif rotation == Direction.LEFT:
-                x -= i
-            elif rotation == Direction.UP:
-                y -= i
-            elif rotation == Direction.DOWN:
-                y += i
-            positions.append((y, x))
-        return positions
-
-    def in_bounds(self) -> bool:
+    ) -> Tuple[Tuple[int, int], ...]:
+        y, x = start_pos
+        return tuple((y + dy, x + dx) for dy, dx in ship_offsets(rotation, ship_size))
+
+    def fits(self, start_pos: Tuple[int, int], rotation: Direction) -> bool:
+        # Only the endpoints need checking, the ship is a straight line
+        dy, dx = DIRECTION_DELTA[rotation]
+        end_pos = (
+            start_pos[0] + dy * (self.size - 1),
+            start_pos[1] + dx * (self.size - 1),
+        )
         return pos_in_bounds(
-            self.positions[0], self.bounds_y, self.bounds_x
-        ) and pos_in_bounds(self.positions[-1], self.bounds_y, self.bounds_x)
+            start_pos, self.bounds_y, self.bounds_x
+        ) and pos_in_bounds(end_pos, self.bounds_y, self.bounds_x)
 
     def update_positions(self, start_pos: Tuple[int, int]) -> bool:
-        old_positions = self.positions
-        self.positions = Ship.generate_positions(start_pos, self.rotation, self.size)
-        if not self.in_bounds():
-            self.positions = old_positions
+        if not self.fits(start_pos, self.rotation):
             return False
-        else:
-            self.start_pos = start_pos
-            return True
+        self.positions = Ship.generate_positions(start_pos, self.rotation, self.size)
+        self.start_pos = start_pos
+        return True
 
     def move(self, direction: Direction):
         if direction == Direction.RIGHT:
@@ -325,35 +372,58 @@ class Ship:
             self.update_positions((self.start_pos[0] + 1, self.start_pos[1]))
 
     def rotate(self):
-        self.rotation = rotate_clockwise(self.rotation)
-        while not self.update_positions(self.start_pos):
-            self.rotation = rotate_clockwise(self.rotation)
-
-    def check_hit(self, hit_pos: Tuple[int, int], is_missile: bool) -> Hit:
-        for i, pos in enumerate(self.positions):
-            if pos == hit_pos:
-                self.hits[i] = is_missile
-                # Check if ship has been sunk
-                if is_missile and all(self.hits):
-                    return Hit.sunk(hit_pos, self.ship_type.value, self.positions)
-                else:
-                    return Hit.hit(hit_pos)
-        return Hit.miss(hit_pos)
+        rotation = rotate_clockwise(self.rotation)
+        while not self.fits(self.start_pos, rotation):
+            rotation = rotate_clockwise(rotation)
+        self.rotation = rotation
+        self.positions = Ship.generate_positions(self.start_pos, rotation, self.size)
+
+    def check_hit(self, index: int, is_missile: bool) -> Hit:
+        hit_pos = self.positions[index]
+        if is_missile:
+            self.hits |= 1 << index
+        else:
+            self.hits &= ~(1 << index)
+        # Check if ship has been sunk
+        if is_missile and self.hits == self.sunk_mask:
+            return Hit.sunk(hit_pos, self.ship_type.value, self.positions)
+        else:
+            return Hit.hit(hit_pos)
 
 
 class Fleet:
     def __init__(self):
         self.ships: List[Ship] = []
+        # Maps every occupied cell to the ship on it and the index of the cell
+        self.cell_map: Dict[Tuple[int, int], Tuple[Ship, int]] = {}
+        self.occupied_cells: Set[Tuple[int, int]] = set()
 
     def add_ship(self, ship: Ship):
         self.ships.append(ship)
+        self.occupied_cells.update(ship.positions)
+        for i, pos in enumerate(ship.positions):
+            self.cell_map[pos] = (ship, i)
 
-    def check_hit(self, hit_pos: Tuple[int, int], is_missile: bool = True) -> Hit:
+    def clone(self) -> "Fleet":
+        fleet = Fleet()
         for ship in self.ships:
-            hit_object = ship.check_hit(hit_pos, is_missile)
-            if hit_object.hit_type != HitType.MISS:
-                return hit_object
-        return Hit.miss(hit_pos)
+            ship_copy = Ship(
+                ship.ship_type,
+                ship.start_pos,
+                ship.rotation,
+                ship.bounds_y,
+                ship.bounds_x,
+            )
+            ship_copy.hits = ship.hits
+            fleet.add_ship(ship_copy)
+        return fleet
+
+    def check_hit(self, hit_pos: Tuple[int, int], is_missile: bool = True) -> Hit:
+        entry = self.cell_map.get(hit_pos)
+        if entry is None:
+            return Hit.miss(hit_pos)
+        ship, i = entry
+        return ship.check_hit(i, is_missile)
 
 
 class GameState(Enum):
@@ -386,18 +456,18 @@ class Manager:
             Information.ai_info(self)
 
         self.game_state = GameState.SETUP
-        self.guesses: List[Tuple[Tuple[int, int], Hit]] = []
+        self.guesses: Dict[Tuple[int, int], Hit] = {}
+        self.shot_positions: Set[Tuple[int, int]] = set()
+        self.opponent_shots: Dict[Tuple[int, int], str] = {}
         self.fleet = Fleet()
         self.player_ships_left = len(ShipType)
         self.opponent_ships_left = len(ShipType)
 
     def __set_bounds(self):
         self.scrheight, self.scrwidth = self.stdscr.getmaxyx()
-        if (
-            self.scrheight < Manager.MIN_WINDOW_HEIGHT
-            or self.scrwidth < Manager.MIN_WINDOW_WIDTH
-        ):
-            self.__await_resize()
+        self.__await_resize(Manager.MIN_WINDOW_HEIGHT, Manager.MIN_WINDOW_WIDTH)
+        # Everything is drawn at fixed positions, so the window can't shrink below this
+        self.layout_height, self.layout_width = self.scrheight, self.scrwidth
 
         self.window_center = (round(self.scrheight / 2), (round(self.scrwidth / 2)))
 
@@ -430,25 +500,58 @@ class Manager:
         self.opponent_bounds_y = (self.bounds_y[0], self.bounds_y[1])
         self.opponent_bounds_x = (self.window_center[1], self.bounds_x[1])
 
-    def __await_resize(self):
+        self.info_layout = InformationLayout(self)
+
+    def __await_resize(self, min_height: int, min_width: int):
+        if self.scrheight >= min_height and self.scrwidth >= min_width:
+            return
         self.stdscr.clear()
         self.stdscr.addstr(0, 0, "Window is too small. Please resize.")
-        while (
-            self.scrheight < Manager.MIN_WINDOW_HEIGHT
-            or self.scrwidth < Manager.MIN_WINDOW_WIDTH
-        ):
-            self.scrheight, self.scrwidth = self.stdscr.getmaxyx()
-            _ = self.stdscr.getkey()
+        while self.scrheight < min_height or self.scrwidth < min_width:
+            # The size can only change on a resize event
+            if self.stdscr.getch() == curses.KEY_RESIZE:
+                self.scrheight, self.scrwidth = self.stdscr.getmaxyx()
+        self.stdscr.clear()
+
+    def __handle_resize(self):
+        self.scrheight, self.scrwidth = self.stdscr.getmaxyx()
+        self.__await_resize(self.layout_height, self.layout_width)
+        self.__redraw()
+
+    def __poll_resize(self):
+        # Read input without blocking so resizes are handled while waiting
+        self.stdscr.nodelay(True)
+        key = self.stdscr.getch()
+        self.stdscr.nodelay(False)
+        if key == curses.KEY_RESIZE:
+            self.__handle_resize()
+
+    def __redraw(self):
         self.stdscr.clear()
+        self.__create_board()
+        Information.disambiguation(self)
+        if isinstance(self.player, LocalPlayer):
+            Information.ai_info(self)
+        Information.status(self)
+        if self.game_state == GameState.SETUP:
+            Information.placing_ships(self)
+        elif self.game_state != GameState.READY:
+            Information.shooting(self)
+
+        for ship in self.fleet.ships:
+            self.__draw_ship(ship)
+        for (y, x), char in self.opponent_shots.items():
+            self.stdscr.addch(y, x, char)
+        for (y, x), hit in self.guesses.items():
+            self.stdscr.addch(y, x, hit.character)
 
     def __create_board(self):
-        for x in range(self.bounds_x[0], self.bounds_x[1] + 1):
-            self.stdscr.addstr(self.bounds_y[0], x, "-")
-            self.stdscr.addstr(self.bounds_y[1], x, "-")
-        for y in range(self.bounds_y[0] + 1, self.bounds_y[1]):
-            self.stdscr.addstr(y, self.bounds_x[0], "|")
-            self.stdscr.addstr(y, self.window_center[1], "|")
-            self.stdscr.addstr(y, self.bounds_x[1], "|")
+        horizontal = "-" * (self.bounds_x[1] - self.bounds_x[0] + 1)
+        self.stdscr.addstr(self.bounds_y[0], self.bounds_x[0], horizontal)
+        self.stdscr.addstr(self.bounds_y[1], self.bounds_x[0], horizontal)
+        height = self.bounds_y[1] - self.bounds_y[0] - 1
+        for x in (self.bounds_x[0], self.window_center[1], self.bounds_x[1]):
+            self.stdscr.vline(self.bounds_y[0] + 1, x, "|", height)
 
     def __loop(self):
         while True:
@@ -468,6 +571,8 @@ class Manager:
     def __ready(self):
         self.stdscr.refresh()
         self.player.ready()
+        while not self.player.try_ready():
+            self.__poll_resize()
         Information.shooting(self)
         self.game_state = GameState.PLAYING
 
@@ -475,34 +580,28 @@ class Manager:
         target_pos = self.opponent_board_center
         old_pos = target_pos
         while True:
-            self.stdscr.addstr(old_pos[0], old_pos[1], " ")
             if not pos_in_bounds(
                 target_pos, self.opponent_bounds_y, self.opponent_bounds_x
             ):
                 target_pos = old_pos
 
-            # Redraw the old position if it was a previous guess
-            previous_guess_result_old_pos = self.__get_previous_guess_result(old_pos)
-            if previous_guess_result_old_pos is not None:
-                self.stdscr.addstr(
-                    old_pos[0], old_pos[1], previous_guess_result_old_pos
-                )
-            # Draw the target
-            previous_guess_result_target_pos = self.__get_previous_guess_result(
-                target_pos
-            )
-            if previous_guess_result_target_pos is None:
-                target_char = "#"
+            # Restore the old position, redrawing it if it was a previous guess
+            if old_pos in self.shot_positions:
+                old_char = self.__get_previous_guess_result(old_pos)
             else:
-                target_char = "-"
+                old_char = " "
+            self.stdscr.addch(old_pos[0], old_pos[1], old_char)
+            # Draw the target
+            already_shot = target_pos in self.shot_positions
+            target_char = "-" if already_shot else "#"
 
-            self.stdscr.addstr(target_pos[0], target_pos[1], target_char)
+            self.stdscr.addch(target_pos[0], target_pos[1], target_char)
 
             old_pos = target_pos
             key = self.stdscr.getch()
             if key == ord(" "):
                 # Space pressed
-                if previous_guess_result_target_pos is None:
+                if not already_shot:
                     self.__fire_missile(target_pos)
                     self.player.players_turn = False
                     break
@@ -517,11 +616,19 @@ class Manager:
                 target_pos = (target_pos[0] - 1, target_pos[1])
             elif key == curses.KEY_DOWN:
                 target_pos = (target_pos[0] + 1, target_pos[1])
+            elif key == curses.KEY_RESIZE:
+                self.__handle_resize()
 
     def __opponents_turn(self):
         self.stdscr.refresh()
-        hit: Hit = self.player.listen_for_move()
+        # Keep the screen alive while waiting, try_receive never blocks for long
+        hit: Optional[Hit] = self.player.try_receive()
+        while hit is None:
+            Information.status(self)
+            self.__poll_resize()
+            hit = self.player.try_receive()
         char = "X" if hit.hit_type != HitType.MISS else "O"
+        self.opponent_shots[hit.target_position] = char
         self.stdscr.addstr(hit.target_position[0], hit.target_position[1], char)
         self.player.players_turn = True
 
@@ -534,7 +641,8 @@ class Manager:
         offset_target_pos = (target_pos[0], self.player_board_center[1] - offset)
         # Check for hit
         hit: Hit = self.player.send_move(offset_target_pos)
-        self.guesses.append((target_pos, hit))
+        self.guesses[target_pos] = hit
+        self.shot_positions.add(target_pos)
 
         self.stdscr.addstr(target_pos[0], target_pos[1], hit.character)
         if hit.hit_type == HitType.SUNK:
@@ -544,23 +652,17 @@ class Manager:
             self.__check_game_over()
 
     def __get_previous_guess_result(self, target: Tuple[int, int]):
-        for (pos, hit) in self.guesses:
-            if target == pos:
-                return hit.character
-        return None
+        hit = self.guesses.get(target)
+        return hit.character if hit is not None else None
 
     def __reveal_sunk_ship(self, hit: Hit):
         for hit_pos in hit.ship_positions:
             # Offset the position to the opponents side
             offset = self.player_board_center[1] - hit_pos[1]
             offset_hit_pos = (hit_pos[0], self.opponent_board_center[1] - offset)
-            for i, (pos, _) in enumerate(self.guesses):
-                if offset_hit_pos == pos:
-                    self.guesses[i] = (offset_hit_pos, hit)
-                    self.stdscr.addstr(
-                        offset_hit_pos[0], offset_hit_pos[1], hit.character
-                    )
-                    break
+            if offset_hit_pos in self.guesses:
+                self.guesses[offset_hit_pos] = hit
+                self.stdscr.addstr(offset_hit_pos[0], offset_hit_pos[1], hit.character)
 
     def __check_game_over(self):
         if self.opponent_ships_left == 0:
@@ -588,7 +690,6 @@ class Manager:
             self.__clear_positions(old_positions)
             old_positions = ship.positions
 
-            self.__draw_all_ships()
             overlaps = self.__draw_ship(ship, check_overlap=True)
 
             key = self.stdscr.getch()
@@ -607,31 +708,62 @@ class Manager:
                 ship.move(Direction.DOWN)
             elif key == ord("r"):
                 ship.rotate()
-
-    def __draw_all_ships(self):
-        for ship in self.fleet.ships:
-            self.__draw_ship(ship)
+            elif key == curses.KEY_RESIZE:
+                self.__handle_resize()
 
     def __draw_ship(self, ship: Ship, check_overlap=False) -> bool:
         overlaps = False
+        occupied = self.fleet.occupied_cells
         for y, x in ship.positions:
             char = ship.ship_type.value
-            if (
-                check_overlap
-                and self.fleet.check_hit((y, x), False).hit_type != HitType.MISS
-            ):
+            if check_overlap and (y, x) in occupied:
                 overlaps = True
                 char = "X"
-            self.stdscr.addstr(y, x, char)
+            self.stdscr.addch(y, x, char)
         return overlaps
 
     def __clear_positions(self, positions):
-        for y, x in positions:
-            self.stdscr.addstr(y, x, " ")
+        # Cells under placed ships are restored instead of blanked, so the
+        # placed ships never need a full redraw
+        cell_map = self.fleet.cell_map
+        for pos in positions:
+            entry = cell_map.get(pos)
+            char = entry[0].ship_type.value if entry is not None else " "
+            self.stdscr.addch(pos[0], pos[1], char)
 
     def __game_over(self):
         Information.game_over(self)
-        self.stdscr.getch()
+        if self.stdscr.getch() == curses.KEY_RESIZE:
+            self.__handle_resize()
+
+
+STATUS_TEXT = {
+    GameState.SETUP: "PLACE YOUR SHIPS",
+    GameState.READY: "WAITING FOR OPPONENT",
+    GameState.PLAYER_WON: "YOU WON!",
+    GameState.OPPONENT_WON: "YOU LOST.",
+}
+PLAYING_STATUS_TEXT = {True: "YOUR TURN", False: "OPPONENTS TURN"}
+
+# (row offset, text) pairs for the multi-line information blocks
+PLACING_SHIPS_LINES = (
+    (2, "Move: Arrow keys"),
+    (3, "Rotate: R key"),
+    (4, "Confirm: Space"),
+)
+SHOOTING_LINES = (
+    (2, "Move: Arrow keys"),
+    (3, "Fire: Space"),
+)
+DISAMBIGUATION_LINES = (
+    (-8, "Disambiguation"),
+    (-6, "P: Patrol boat (2)"),
+    (-5, "S: Submarine (3)"),
+    (-4, "D: Destroyer (3)"),
+    (-3, "B: Battleship (4)"),
+    (-2, "C: Carrier (5)"),
+)
+
 
 class TextAlignment(Enum):
     CENTER = auto()
@@ -644,6 +776,45 @@ class TextAlignment(Enum):
             return x
 
 
+class InformationLayout:
+    # Aligned positions and blanks are computed once per layout, not per draw
+    def __init__(self, manager: Manager):
+        center_x = manager.window_center[1]
+        self.status_y = manager.bounds_y[0] - 2
+        self.status_blank = " " * (manager.scrwidth - 1)
+        self.status_blank_x = TextAlignment.align(
+            center_x, self.status_blank, TextAlignment.CENTER
+        )
+        self.status_x = {
+            text: TextAlignment.align(center_x, text, TextAlignment.CENTER)
+            for text in chain(STATUS_TEXT.values(), PLAYING_STATUS_TEXT.values())
+        }
+        self.placing_ships_lines = InformationLayout.__text_lines(
+            PLACING_SHIPS_LINES, manager.bounds_y[1], center_x, TextAlignment.CENTER
+        )
+        self.shooting_lines = InformationLayout.__text_lines(
+            SHOOTING_LINES, manager.bounds_y[1], center_x, TextAlignment.CENTER
+        )
+        self.disambiguation_lines = InformationLayout.__text_lines(
+            DISAMBIGUATION_LINES,
+            manager.window_center[0],
+            manager.bounds_x[1] + 5,
+            TextAlignment.LEFT,
+        )
+
+    @staticmethod
+    def __text_lines(lines, y, x, alignment: TextAlignment):
+        return [
+            (
+                y + y_offset,
+                TextAlignment.align(x, text, alignment),
+                text,
+                " " * len(text),
+            )
+            for y_offset, text in lines
+        ]
+
+
 class Information:
     @staticmethod
     def __add_text(stdscr, y, x, text, alignment: TextAlignment = TextAlignment.CENTER):
@@ -665,79 +836,33 @@ class Information:
             Information.__clear_text(stdscr, y, x, text, alignment)
 
     @staticmethod
-    def __clear_status(manager: Manager):
-        text = " " * (manager.scrwidth - 1)
-        Information.__add_text(
-            manager.stdscr,
-            manager.bounds_y[0] - 2,
-            manager.window_center[1],
-            text,
-        )
+    def __draw_lines(stdscr, lines, clear):
+        for y, x, text, blank in lines:
+            stdscr.addstr(y, x, blank if clear else text)
 
     @staticmethod
     def status(manager: Manager):
-        if manager.game_state == GameState.SETUP:
-            text = "PLACE YOUR SHIPS"
-        elif manager.game_state == GameState.READY:
-            text = "WAITING FOR OPPONENT"
-        elif manager.game_state == GameState.PLAYING:
-            if manager.player.players_turn:
-                text = "YOUR TURN"
-            else:
-                text = "OPPONENTS TURN"
-        elif manager.game_state == GameState.PLAYER_WON:
-            text = "YOU WON!"
-        elif manager.game_state == GameState.OPPONENT_WON:
-            text = "YOU LOST."
+        if manager.game_state == GameState.PLAYING:
+            text = PLAYING_STATUS_TEXT[manager.player.players_turn]
+        else:
+            text = STATUS_TEXT[manager.game_state]
 
-        Information.__clear_status(manager)
-        Information.__update_info(
-            manager.stdscr,
-            manager.bounds_y[0] - 2,
-            manager.window_center[1],
-            text,
-            False,
+        layout = manager.info_layout
+        manager.stdscr.addstr(
+            layout.status_y, layout.status_blank_x, layout.status_blank
         )
+        manager.stdscr.addstr(layout.status_y, layout.status_x[text], text)
 
     @staticmethod
     def placing_ships(manager: Manager, clear=False):
-        Information.__update_info(
-            manager.stdscr,
-            manager.bounds_y[1] + 2,
-            manager.window_center[1],
-            "Move: Arrow keys",
-            clear,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.bounds_y[1] + 3,
-            manager.window_center[1],
-            "Rotate: R key",
-            clear,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.bounds_y[1] + 4,
-            manager.window_center[1],
-            "Confirm: Space",
-            clear,
+        Information.__draw_lines(
+            manager.stdscr, manager.info_layout.placing_ships_lines, clear
         )
 
     @staticmethod
     def shooting(manager: Manager, clear=False):
-        Information.__update_info(
-            manager.stdscr,
-            manager.bounds_y[1] + 2,
-            manager.window_center[1],
-            "Move: Arrow keys",
-            clear,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.bounds_y[1] + 3,
-            manager.window_center[1],
-            "Fire: Space",
-            clear,
+        Information.__draw_lines(
+            manager.stdscr, manager.info_layout.shooting_lines, clear
         )
 
     @staticmethod
@@ -746,53 +871,8 @@ class Information:
 
     @staticmethod
     def disambiguation(manager: Manager, clear=False):
-        Information.__update_info(
-            manager.stdscr,
-            manager.window_center[0] - 8,
-            manager.bounds_x[1] + 5,
-            "Disambiguation",
-            clear,
-            alignment=TextAlignment.LEFT,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.window_center[0] - 6,
-            manager.bounds_x[1] + 5,
-            "P: Patrol boat (2)",
-            clear,
-            alignment=TextAlignment.LEFT,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.window_center[0] - 5,
-            manager.bounds_x[1] + 5,
-            "S: Submarine (3)",
-            clear,
-            alignment=TextAlignment.LEFT,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.window_center[0] - 4,
-            manager.bounds_x[1] + 5,
-            "D: Destroyer (3)",
-            clear,
-            alignment=TextAlignment.LEFT,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.window_center[0] - 3,
-            manager.bounds_x[1] + 5,
-            "B: Battleship (4)",
-            clear,
-            alignment=TextAlignment.LEFT,
-        )
-        Information.__update_info(
-            manager.stdscr,
-            manager.window_center[0] - 2,
-            manager.bounds_x[1] + 5,
-            "C: Carrier (5)",
-            clear,
-            alignment=TextAlignment.LEFT,
+        Information.__draw_lines(
+            manager.stdscr, manager.info_layout.disambiguation_lines, clear
         )
 
     @staticmethod